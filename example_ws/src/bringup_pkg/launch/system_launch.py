@@ -12,7 +12,11 @@ Usage:
 """
 
 import asyncio
+import logging
+import logging.handlers
 import os
+import queue
+import shlex
 import sys
 
 try:
@@ -30,12 +34,28 @@ SRC_DIR = os.path.dirname(BRINGUP_DIR)        # examples/src/
 EXAMPLES_DIR = os.path.dirname(SRC_DIR)        # examples/
 ROOT_DIR = os.path.dirname(EXAMPLES_DIR)       # tagentacle-py/
 RUST_CORE_DIR = os.path.join(ROOT_DIR, "..", "tagentacle")
+DAEMON_ARGV = ["cargo", "run", "--", "daemon", "--addr"]
+
+logger = logging.getLogger("tagentacle.bringup")
+
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """Route launcher logging through a queue so stdout writes happen off the event loop.
+
+    Returns the started listener; call stop() on it to flush remaining records.
+    """
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    logging.basicConfig(level=logging.INFO, format="%(message)s",
+                        handlers=[logging.handlers.QueueHandler(log_queue)])
+    listener.start()
+    return listener
 
 
 def load_config(config_path: str) -> dict:
     """Load launch configuration from TOML file."""
     if tomllib is None:
-        print("Warning: tomllib not available. Using fallback hardcoded config.")
+        logger.warning("Warning: tomllib not available. Using fallback hardcoded config.")
         return get_fallback_config()
 
     with open(config_path, "rb") as f:
@@ -59,7 +79,6 @@ def get_fallback_config() -> dict:
                 "command": "python client.py",
                 "description": "Agent calling weather tools",
                 "depends_on": ["mcp_server_node"],
-                "startup_delay": 2,
             },
         ],
         "parameters": {
@@ -68,23 +87,52 @@ def get_fallback_config() -> dict:
     }
 
 
-async def run_process(cmd: str, cwd: str, name: str, env: dict = None):
-    """Run a subprocess with output logging."""
-    print(f"[{name}] Starting: {cmd}")
-    merged_env = {**os.environ, **(env or {})}
-    process = await asyncio.create_subprocess_shell(
-        cmd, cwd=cwd,
+def to_argv(cmd) -> list:
+    """Normalize a command (shell-style string or argv list) to an argv list."""
+    if isinstance(cmd, str):
+        return shlex.split(cmd)
+    return [str(arg) for arg in cmd]
+
+
+async def run_process(cmd, cwd: str, name: str, env: dict = None,
+                      ready_event: asyncio.Event = None):
+    """Run a subprocess (directly, without a shell) with output logging.
+
+    `env` is the complete child environment (None inherits the launcher's).
+    If `ready_event` is given, it is set once the child logs that its
+    Node `name` has connected to the Daemon.
+    """
+    ready_marker = f"Node '{name}' connected."
+    argv = to_argv(cmd)
+    logger.info(f"[{name}] Starting: {shlex.join(argv)}")
+    process = await asyncio.create_subprocess_exec(
+        *argv, cwd=cwd,
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.STDOUT,
-        env=merged_env,
+        env=env,
     )
 
     async def log_output():
+        # Read in large chunks and split lines locally rather than one readline() per line
+        buf = b""
         while True:
-            line = await process.stdout.readline()
-            if not line:
+            chunk = await process.stdout.read(65536)
+            if not chunk:
                 break
-            print(f"[{name}] {line.decode().strip()}")
+            buf += chunk
+            *lines, buf = buf.split(b"\n")
+            if not lines:
+                continue
+            out = []
+            for line in lines:
+                text = line.decode(errors='replace').strip()
+                out.append(f"[{name}] {text}")
+                if ready_event is not None and ready_marker in text:
+                    ready_event.set()
+            # One log record per chunk rather than per line
+            logger.info("\n".join(out))
+        if buf:
+            logger.info(f"[{name}] {buf.decode(errors='replace').strip()}")
 
     asyncio.create_task(log_output())
     return process
@@ -103,10 +151,10 @@ async def main():
     config_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(LAUNCH_DIR, "system_launch.toml")
     if os.path.exists(config_path):
         config = load_config(config_path)
-        print(f"--- Tagentacle Bringup: loaded {config_path} ---")
+        logger.info(f"--- Tagentacle Bringup: loaded {config_path} ---")
     else:
         config = get_fallback_config()
-        print(f"--- Tagentacle Bringup: using fallback config (no {config_path}) ---")
+        logger.info(f"--- Tagentacle Bringup: using fallback config (no {config_path}) ---")
 
     # Extract parameters for env injection
     params = config.get("parameters", {})
@@ -133,11 +181,14 @@ async def main():
                 for k, v in secret_data.items():
                     if isinstance(v, str):
                         inject_env[k] = v
-                print(f"[BRINGUP] Loaded {len(secret_data)} secret(s) from {secrets_path}")
+                logger.info(f"[BRINGUP] Loaded {len(secret_data)} secret(s) from {secrets_path}")
             except Exception as e:
-                print(f"[BRINGUP] Warning: failed to load secrets: {e}")
+                logger.warning(f"[BRINGUP] Warning: failed to load secrets: {e}")
         else:
-            print(f"[BRINGUP] Secrets file not found: {secrets_path} (skipped)")
+            logger.info(f"[BRINGUP] Secrets file not found: {secrets_path} (skipped)")
+
+    # Environment shared by all nodes, merged once
+    base_env = {**os.environ, **inject_env}
 
     processes = []
 
@@ -145,65 +196,84 @@ async def main():
     daemon_addr = config.get("daemon", {}).get("addr", "127.0.0.1:19999")
     if os.path.isdir(RUST_CORE_DIR):
         daemon = await run_process(
-            f"cargo run -- daemon --addr {daemon_addr}",
+            [*DAEMON_ARGV, daemon_addr],
             RUST_CORE_DIR, "DAEMON"
         )
         processes.append(("DAEMON", daemon))
         await asyncio.sleep(3)
     else:
-        print("[BRINGUP] Rust core not found, assuming Daemon is already running.")
+        logger.info("[BRINGUP] Rust core not found, assuming Daemon is already running.")
 
     # 2. Launch nodes in order (respecting depends_on)
     nodes = config.get("nodes", [])
-    launched = set()
+    # Set when each node reports it has connected to the Daemon
+    ready_events = {node_cfg["name"]: asyncio.Event() for node_cfg in nodes}
 
     for node_cfg in nodes:
         name = node_cfg["name"]
         package = node_cfg["package"]
         command = node_cfg["command"]
         depends = node_cfg.get("depends_on", [])
-        delay = node_cfg.get("startup_delay", 1)
+        ready_timeout = node_cfg.get("ready_timeout", 30)
+        node_env = node_cfg.get("env")
 
-        # Wait for dependencies
+        # Wait for dependencies to become ready
         for dep in depends:
-            if dep not in launched:
-                print(f"[{name}] Waiting for dependency '{dep}'...")
-                await asyncio.sleep(delay)
+            if dep not in ready_events:
+                logger.warning(f"[{name}] Warning: unknown dependency '{dep}' (ignored)")
+        waiting = [dep for dep in depends if dep in ready_events and not ready_events[dep].is_set()]
+        if waiting:
+            logger.info(f"[{name}] Waiting for dependencies {waiting}...")
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*(ready_events[dep].wait() for dep in waiting)),
+                    timeout=ready_timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"[{name}] Warning: dependencies not ready after {ready_timeout}s, launching anyway.")
 
         pkg_dir = resolve_package_dir(package)
-        proc = await run_process(command, pkg_dir, name, env=inject_env)
+        env = {**base_env, **{k: str(v) for k, v in node_env.items()}} if node_env else base_env
+        proc = await run_process(command, pkg_dir, name, env=env,
+                                 ready_event=ready_events[name])
         processes.append((name, proc))
-        launched.add(name)
-
-        if delay > 0:
-            await asyncio.sleep(delay)
 
     # 3. Wait for agent to finish (last node)
     if processes:
         last_name, last_proc = processes[-1]
-        print(f"[BRINGUP] Waiting for '{last_name}' to complete...")
+        logger.info(f"[BRINGUP] Waiting for '{last_name}' to complete...")
         await last_proc.wait()
 
     # 4. Graceful shutdown
-    print("--- Bringup: Shutting down all nodes ---")
+    logger.info("--- Bringup: Shutting down all nodes ---")
     for name, proc in reversed(processes):
         try:
             if proc.returncode is None:
                 proc.terminate()
                 await asyncio.wait_for(proc.wait(), timeout=5.0)
-                print(f"[{name}] terminated.")
+                logger.info(f"[{name}] terminated.")
         except (asyncio.TimeoutError, ProcessLookupError):
             try:
                 proc.kill()
             except ProcessLookupError:
                 pass
 
-    print("--- Bringup complete ---")
+    logger.info("--- Bringup complete ---")
 
 
 if __name__ == "__main__":
+    log_listener = setup_logging()
+    # Same opt-in uvloop setup as tagentacle_py; policies are deprecated on 3.14+
+    if sys.version_info < (3, 14) and os.environ.get("TAGENTACLE_LOOP", "").lower() != "asyncio":
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
-        print("\nBringup interrupted.")
+        logger.info("\nBringup interrupted.")
+    finally:
+        log_listener.stop()
 
@@ -1,10 +1,60 @@
 import asyncio
+import inspect
+import itertools
 import json
 import logging
 import os
-import uuid
+import socket
+import stat
+import sys
 from enum import Enum
-from typing import Callable, Dict, Any, List, Optional
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    # Fallback: stdlib json, adapted to the same bytes-in/bytes-out interface
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data).encode()
+
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+# Frame delimiter for the newline-delimited JSON wire protocol
+_NEWLINE = b"\n"
+
+# Parsing a frame in a worker thread only keeps the event loop responsive when the
+# two can run in parallel (free-threaded CPython); under the GIL it just adds a handoff.
+_PARALLEL_PARSE = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+# Daemon hosts for which a configured UNIX domain socket (TAGENTACLE_DAEMON_UDS) replaces TCP
+_LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+
+def _install_event_loop():
+    """Use uvloop as the asyncio event loop when available.
+    
+    Opt out with TAGENTACLE_LOOP=asyncio. Skipped on Python 3.14+, where event
+    loop policies are deprecated; run entrypoints with uvloop.run(main()) there.
+    """
+    if sys.version_info >= (3, 14):
+        return
+    if os.environ.get("TAGENTACLE_LOOP", "").lower() == "asyncio":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+_install_event_loop()
 
 
 def _load_secrets_file(path: str) -> Dict[str, str]:
@@ -48,6 +98,19 @@ class Node:
     integration with the Tagentacle bus. No lifecycle management.
     """
 
+    # Outbound buffer size (bytes) above which a send writes and drains immediately
+    _SEND_HIGH_WATER = 64 * 1024
+    # Subscriber callbacks run on a fixed pool of workers; when no worker is idle
+    # they run on their own tasks instead, so spin() never blocks
+    _DISPATCH_WORKERS = 8
+    # Default largest inbound frame (bytes) spin() will buffer; larger frames are
+    # discarded. Override with TAGENTACLE_MAX_FRAME_SIZE.
+    _READ_LIMIT = 16 * 1024 * 1024
+    # Kernel send/receive buffer size (bytes) requested for the TCP connection
+    _SOCKET_BUFFER_SIZE = 1024 * 1024
+    # Inbound frames larger than this (bytes) are parsed off the event loop when possible
+    _OFFLOAD_PARSE_SIZE = 64 * 1024
+
     def __init__(self, node_id: str):
         self.node_id = node_id
         self.logger = logging.getLogger(f"tagentacle.{node_id}")
@@ -57,16 +120,35 @@ class Node:
             url = url[6:]
         self.host, port_str = url.split(":")
         self.port = int(port_str)
+        self._read_limit = int(os.environ.get("TAGENTACLE_MAX_FRAME_SIZE", self._READ_LIMIT))
         
         self.reader = None
         self.writer = None
         self._connected = False
-        # topic -> List[async-callbacks]
-        self.subscribers: Dict[str, List[Callable]] = {}
+        # topic -> List[(is_async, callback)], classified once at subscribe time
+        self.subscribers: Dict[str, List[Tuple[bool, Callable]]] = {}
         # service -> callback
         self.services: Dict[str, Callable] = {}
         # request_id -> Future
         self.pending_requests: Dict[str, asyncio.Future] = {}
+        # request_id = "<node_id>:<pid>:<n>": unique on the bus without a per-call uuid4()
+        self._req_id_prefix = f"{node_id}:{os.getpid()}:"
+        self._req_counter = itertools.count()
+        # Outbound frame chunks, coalesced into one writelines() per event-loop iteration
+        self._send_frames: List[bytes] = []
+        self._send_size = 0
+        self._flush_scheduled = False
+        # (awaitable, topic) queue drained by the subscriber worker pool
+        self._dispatch_q: Optional[asyncio.Queue] = None
+        self._dispatch_workers: List[asyncio.Task] = []
+        # Workers currently waiting on the queue for a callback
+        self._dispatch_idle = 0
+        # Inbound op -> handler, looked up once per message in spin()
+        self._op_handlers: Dict[str, Callable] = {
+            "message": self._on_message,
+            "call_service": self._on_call_service,
+            "service_response": self._on_service_response,
+        }
         
         # Auto-load secrets from TAGENTACLE_SECRETS_FILE if set
         self._secrets: Dict[str, str] = {}
@@ -82,10 +164,31 @@ class Node:
         return self._secrets
 
     async def connect(self):
-        """Connect to Tagentacle Daemon bus and register existing subscriptions and services."""
-        self.logger.info(f"Connecting to Tagentacle Daemon at {self.host}:{self.port}...")
-        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        """Connect to Tagentacle Daemon bus and register existing subscriptions and services.
+        
+        For a local daemon, the UNIX domain socket named by TAGENTACLE_DAEMON_UDS
+        is used when that variable is set and the path is a socket, falling back to TCP.
+        """
+        uds_path = self._local_socket_path()
+        if uds_path:
+            self.logger.info(f"Connecting to Tagentacle Daemon at unix://{uds_path}...")
+            try:
+                self.reader, self.writer = await asyncio.open_unix_connection(
+                    uds_path, limit=self._read_limit)
+            except OSError as e:
+                self.logger.warning(f"UNIX socket {uds_path} unavailable ({e}), falling back to TCP")
+                uds_path = None
+        if not uds_path:
+            self.logger.info(f"Connecting to Tagentacle Daemon at {self.host}:{self.port}...")
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port, limit=self._read_limit)
+            self._tune_tcp_socket()
         self._connected = True
+        self._dispatch_q = asyncio.Queue()
+        self._dispatch_workers = [
+            asyncio.create_task(self._dispatch_worker(self._dispatch_q))
+            for _ in range(self._DISPATCH_WORKERS)
+        ]
         self.logger.info(f"Node '{self.node_id}' connected.")
         
         # Batch register pre-defined subscriptions
@@ -96,28 +199,76 @@ class Node:
         for service in self.services.keys():
             await self._register_service(service)
 
+    def _local_socket_path(self) -> Optional[str]:
+        """Return the configured UNIX socket path if the daemon is local and the path is a socket.
+        
+        Only an explicit TAGENTACLE_DAEMON_UDS is honoured: a default path in a
+        shared directory could be claimed by another local user.
+        """
+        path = os.environ.get("TAGENTACLE_DAEMON_UDS", "")
+        if not path or self.host not in _LOCAL_HOSTS or not hasattr(socket, "AF_UNIX"):
+            return None
+        try:
+            if stat.S_ISSOCK(os.stat(path).st_mode):
+                return path
+        except OSError:
+            pass
+        self.logger.warning(f"TAGENTACLE_DAEMON_UDS={path} is not a socket, using TCP")
+        return None
+
+    def _tune_tcp_socket(self):
+        """Disable Nagle and enlarge kernel buffers on the TCP connection (best effort)."""
+        sock = self.writer.get_extra_info("socket")
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self._SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self._SOCKET_BUFFER_SIZE)
+        except OSError as e:
+            self.logger.debug(f"Could not tune TCP socket options: {e}")
+
     async def disconnect(self):
         """Gracefully disconnect from the Tagentacle Daemon."""
         self._connected = False
+        queue = self._dispatch_q
+        self._dispatch_q = None
+        if queue is not None:
+            # Callbacks still queued run to completion on their own tasks; workers
+            # finish their current callback, then exit on the None sentinel
+            while not queue.empty():
+                asyncio.create_task(self._run_callback(*queue.get_nowait()))
+            for _ in self._dispatch_workers:
+                queue.put_nowait(None)
+        self._dispatch_workers = []
         if self.writer:
             try:
+                self._flush()
                 self.writer.close()
                 await self.writer.wait_closed()
             except Exception:
                 pass
             self.writer = None
             self.reader = None
+        self._send_frames = []
+        self._send_size = 0
         self.logger.info(f"Node '{self.node_id}' disconnected.")
 
     def subscribe(self, topic: str):
-        """Decorator: Subscribe to a specified Topic and register an async callback."""
+        """Decorator: Subscribe to a specified Topic and register a callback.
+        
+        Async callbacks run on the dispatch worker pool; other callables are
+        called inline from spin() and should return quickly. If such a callable
+        returns an awaitable (e.g. a lambda wrapping a coroutine function), the
+        awaitable is run on the worker pool.
+        """
         def decorator(func: Callable):
             if topic not in self.subscribers:
                 self.subscribers[topic] = []
                 # If already connected, register immediately (for dynamic subscription scenarios)
                 if self._connected:
                     asyncio.create_task(self._register_subscription(topic))
-            self.subscribers[topic].append(func)
+            self.subscribers[topic].append((asyncio.iscoroutinefunction(func), func))
             return func
         return decorator
 
@@ -140,6 +291,26 @@ class Node:
         }
         await self._send_json(msg)
 
+    async def publish_many(self, topic: str, payloads: Iterable[Any]):
+        """Publish a burst of messages to a specified Topic with a single write + drain."""
+        if self.writer and self._connected:
+            sender = self.node_id
+            # Encode the whole burst first so a failing payload queues nothing
+            frames: List[bytes] = []
+            size = 0
+            for payload in payloads:
+                frame = _json_dumps({
+                    "op": "publish",
+                    "topic": topic,
+                    "sender": sender,
+                    "payload": payload
+                })
+                frames += (frame, _NEWLINE)
+                size += len(frame) + 1
+            self._send_frames += frames
+            self._send_size += size
+            await self.flush()
+
     def service(self, service_name: str):
         """Decorator: Provide a specified Service and register an async callback."""
         def decorator(func: Callable):
@@ -162,7 +333,8 @@ class Node:
 
     async def call_service(self, service_name: str, payload: Any, timeout: float = 30.0):
         """Call service and wait for response with timeout."""
-        request_id = str(uuid.uuid4())
+        request_id = f"{self._req_id_prefix}{next(self._req_counter)}"
+        # Futures are not pooled: a completed asyncio.Future cannot be reset safely
         future = asyncio.get_running_loop().create_future()
         self.pending_requests[request_id] = future
         
@@ -184,10 +356,32 @@ class Node:
             self.pending_requests.pop(request_id, None)
 
     async def _send_json(self, data: Dict):
-        """Send a single line JSON (with newline)."""
+        """Queue a single line JSON (with newline) for the next batched write."""
         if self.writer and self._connected:
-            line = json.dumps(data) + "\n"
-            self.writer.write(line.encode())
+            frame = _json_dumps(data)
+            self._send_frames += (frame, _NEWLINE)
+            self._send_size += len(frame) + 1
+            if (self._send_size >= self._SEND_HIGH_WATER or
+                    self.writer.transport.get_write_buffer_size() >= self._SEND_HIGH_WATER):
+                await self.flush()
+            elif not self._flush_scheduled:
+                self._flush_scheduled = True
+                asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush(self):
+        """Write all buffered frames to the transport in a single call."""
+        self._flush_scheduled = False
+        if self._send_frames and self.writer:
+            # writelines() hands the chunks to the transport without joining them first
+            # where supported (vectored send); otherwise it joins them once.
+            self.writer.writelines(self._send_frames)
+            self._send_frames = []
+            self._send_size = 0
+
+    async def flush(self):
+        """Write any buffered outbound frames and wait for the transport to drain."""
+        self._flush()
+        if self.writer:
             await self.writer.drain()
 
     async def spin(self):
@@ -195,43 +389,118 @@ class Node:
         if not self.reader:
             raise RuntimeError("Node is not connected. Call await node.connect() first.")
         
+        # Hot-loop lookups bound to locals once
+        reader = self.reader
+        readuntil = reader.readuntil
+        handlers = self._op_handlers
+        loads = _json_loads
+        loop = asyncio.get_running_loop()
+        offload_size = self._OFFLOAD_PARSE_SIZE if _PARALLEL_PARSE else None
+        # True while skipping the remainder of a frame larger than _read_limit
+        discarding = False
         try:
-            while self._connected and not self.reader.at_eof():
-                line = await self.reader.readline()
-                if not line:
+            while self._connected:
+                try:
+                    line = await readuntil(_NEWLINE)
+                except asyncio.IncompleteReadError:
                     break
+                except asyncio.LimitOverrunError as e:
+                    if not discarding:
+                        self.logger.warning(
+                            f"Discarding inbound frame larger than {self._read_limit} bytes "
+                            f"(raise TAGENTACLE_MAX_FRAME_SIZE to accept it)")
+                        discarding = True
+                    await reader.readexactly(e.consumed)
+                    continue
+                if discarding:
+                    discarding = False
+                    continue
                 
                 try:
-                    msg = json.loads(line.decode())
-                    await self._dispatch(msg)
-                except json.JSONDecodeError:
+                    if offload_size is not None and len(line) > offload_size:
+                        msg = await loop.run_in_executor(None, loads, line)
+                    else:
+                        msg = loads(line)
+                    handler = handlers.get(msg.get("op"))
+                    if handler:
+                        handler(msg)
+                except _JSONDecodeError:
                     continue
+                except KeyError as e:
+                    self.logger.warning(f"Dropping malformed {msg.get('op')} frame: missing {e}")
         except asyncio.CancelledError:
             pass
         finally:
             await self.disconnect()
 
-    async def _dispatch(self, msg: Dict):
-        """Dispatch an inbound message to the appropriate handler."""
-        op = msg.get("op")
-        
-        if op == "message":
-            topic = msg.get("topic")
-            if topic in self.subscribers:
-                for callback in self.subscribers[topic]:
-                    asyncio.create_task(callback(msg))
-        
-        elif op == "call_service":
-            service_name = msg.get("service")
-            if service_name in self.services:
-                asyncio.create_task(self._handle_service_call(msg))
+    def _on_message(self, msg: Dict):
+        """Queue a topic message for each of its subscriber callbacks."""
+        callbacks = self.subscribers.get(msg["topic"])
+        if callbacks and self._dispatch_q is not None:
+            for is_async, callback in callbacks:
+                if is_async:
+                    self._enqueue_callback(callback(msg), msg["topic"])
+                    continue
+                try:
+                    result = callback(msg)
+                except Exception as e:
+                    self.logger.error(f"Error in subscriber callback for topic {msg['topic']}: {e}")
+                    continue
+                if inspect.isawaitable(result):
+                    self._enqueue_callback(result, msg["topic"])
+
+    def _on_call_service(self, msg: Dict):
+        """Start handling an inbound service request for a locally provided service."""
+        if msg["service"] in self.services:
+            asyncio.create_task(self._handle_service_call(msg))
+
+    def _on_service_response(self, msg: Dict):
+        """Resolve the pending call_service() future for a service response."""
+        future = self.pending_requests.get(msg["request_id"])
+        if future is not None and not future.done():
+            future.set_result(msg.get("payload"))
+
+    def _enqueue_callback(self, awaitable, topic: str):
+        """Hand a subscriber coroutine to the worker pool without blocking spin().
         
-        elif op == "service_response":
-            request_id = msg.get("request_id")
-            if request_id in self.pending_requests:
-                future = self.pending_requests[request_id]
-                if not future.done():
-                    future.set_result(msg.get("payload"))
+        Only queues the coroutine when an idle worker is free to take it. If
+        every worker is busy (e.g. awaiting a call_service() response or another
+        subscriber's message), it runs on its own task instead, so it never waits
+        behind callbacks that may be waiting on it.
+        """
+        queue = self._dispatch_q
+        if queue.qsize() < self._dispatch_idle:
+            queue.put_nowait((awaitable, topic))
+        else:
+            asyncio.create_task(self._run_callback(awaitable, topic))
+
+    async def _run_callback(self, awaitable, topic: str):
+        """Await a subscriber callback, logging any exception it raises."""
+        try:
+            await awaitable
+        except Exception as e:
+            self.logger.error(f"Error in subscriber callback for topic {topic}: {e}")
+
+    async def _dispatch_worker(self, queue: asyncio.Queue):
+        """Run queued subscriber callbacks until a None sentinel arrives."""
+        while True:
+            self._dispatch_idle += 1
+            try:
+                item = await queue.get()
+            finally:
+                self._dispatch_idle -= 1
+            if item is None:
+                break
+            try:
+                await self._run_callback(*item)
+            except asyncio.CancelledError:
+                # Keep serving unless this worker itself is being cancelled (e.g.
+                # asyncio.run() shutdown). Task.cancelling() needs Python 3.11+;
+                # on 3.10 the worker exits and later callbacks run as tasks.
+                cancelling = getattr(asyncio.current_task(), "cancelling", None)
+                if cancelling is None or cancelling():
+                    raise
+                self.logger.error(f"Subscriber callback for topic {item[1]} was cancelled")
 
     async def _handle_service_call(self, msg: Dict):
         """Handle inbound service requests."""
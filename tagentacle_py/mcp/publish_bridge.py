@@ -41,8 +41,26 @@ class MCPPublishBridge:
                            If None, all topics are allowed.
         """
         self.node = Node(node_id)
-        self.allowed_topics = allowed_topics
+        # Normalized to a tuple so the allow-list check is a single str.startswith() call
+        self.allowed_topics = tuple(allowed_topics) if allowed_topics is not None else None
         self._tools = self._build_tool_definitions()
+        # JSON-RPC results that are fixed for the bridge's lifetime, built once
+        self._initialize_result = {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {
+                "tools": {"listChanged": False}
+            },
+            "serverInfo": {
+                "name": "tagentacle-publish-bridge",
+                "version": "0.1.0"
+            }
+        }
+        self._tools_list_result = {"tools": self._tools}
+        # Tool name -> implementation, dispatched with a single dict lookup
+        self._tool_impls = {
+            "publish_to_topic": self._impl_publish,
+            "list_available_topics": self._impl_list,
+        }
 
     def _build_tool_definitions(self):
         """Build MCP tool definitions for the publish bridge."""
@@ -104,23 +122,14 @@ class MCPPublishBridge:
             return {
                 "jsonrpc": "2.0",
                 "id": rpc_id,
-                "result": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {
-                        "tools": {"listChanged": False}
-                    },
-                    "serverInfo": {
-                        "name": "tagentacle-publish-bridge",
-                        "version": "0.1.0"
-                    }
-                }
+                "result": self._initialize_result
             }
 
         elif method == "tools/list":
             return {
                 "jsonrpc": "2.0",
                 "id": rpc_id,
-                "result": {"tools": self._tools}
+                "result": self._tools_list_result
             }
 
         elif method == "tools/call":
@@ -144,64 +153,68 @@ class MCPPublishBridge:
 
     async def _call_tool(self, rpc_id, tool_name: str, arguments: dict):
         """Execute an MCP tool call."""
-        try:
-            if tool_name == "publish_to_topic":
-                topic = arguments.get("topic", "")
-                payload = arguments.get("payload", {})
-
-                # Check topic allowlist
-                if self.allowed_topics is not None:
-                    if not any(topic.startswith(prefix) for prefix in self.allowed_topics):
-                        return {
-                            "jsonrpc": "2.0",
-                            "id": rpc_id,
-                            "result": {
-                                "content": [{"type": "text",
-                                             "text": f"Error: Topic '{topic}' is not in the allow-list."}],
-                                "isError": True
-                            }
-                        }
+        impl = self._tool_impls.get(tool_name)
+        if impl is None:
+            return {
+                "jsonrpc": "2.0",
+                "id": rpc_id,
+                "error": {"code": -32601, "message": f"Unknown tool: {tool_name}"}
+            }
 
-                await self.node.publish(topic, payload)
-                return {
-                    "jsonrpc": "2.0",
-                    "id": rpc_id,
-                    "result": {
-                        "content": [{"type": "text",
-                                     "text": f"Published to '{topic}' successfully."}]
-                    }
+        try:
+            return await impl(rpc_id, arguments)
+        except Exception as e:
+            logger.error(f"Tool execution error: {e}")
+            return {
+                "jsonrpc": "2.0",
+                "id": rpc_id,
+                "result": {
+                    "content": [{"type": "text", "text": f"Error: {str(e)}"}],
+                    "isError": True
                 }
+            }
+
+    async def _impl_publish(self, rpc_id, arguments: dict):
+        """Tool: publish_to_topic."""
+        topic = arguments.get("topic", "")
+        payload = arguments.get("payload", {})
 
-            elif tool_name == "list_available_topics":
-                if self.allowed_topics is None:
-                    topics_info = "All topics are allowed (no restrictions)."
-                else:
-                    topics_info = f"Allowed topic prefixes: {self.allowed_topics}"
+        # Check topic allowlist
+        if self.allowed_topics is not None:
+            if not topic.startswith(self.allowed_topics):
                 return {
                     "jsonrpc": "2.0",
                     "id": rpc_id,
                     "result": {
-                        "content": [{"type": "text", "text": topics_info}]
+                        "content": [{"type": "text",
+                                     "text": f"Error: Topic '{topic}' is not in the allow-list."}],
+                        "isError": True
                     }
                 }
 
-            else:
-                return {
-                    "jsonrpc": "2.0",
-                    "id": rpc_id,
-                    "error": {"code": -32601, "message": f"Unknown tool: {tool_name}"}
-                }
+        await self.node.publish(topic, payload)
+        return {
+            "jsonrpc": "2.0",
+            "id": rpc_id,
+            "result": {
+                "content": [{"type": "text",
+                             "text": f"Published to '{topic}' successfully."}]
+            }
+        }
 
-        except Exception as e:
-            logger.error(f"Tool execution error: {e}")
-            return {
-                "jsonrpc": "2.0",
-                "id": rpc_id,
-                "result": {
-                    "content": [{"type": "text", "text": f"Error: {str(e)}"}],
-                    "isError": True
-                }
+    async def _impl_list(self, rpc_id, arguments: dict):
+        """Tool: list_available_topics."""
+        if self.allowed_topics is None:
+            topics_info = "All topics are allowed (no restrictions)."
+        else:
+            topics_info = f"Allowed topic prefixes: {list(self.allowed_topics)}"
+        return {
+            "jsonrpc": "2.0",
+            "id": rpc_id,
+            "result": {
+                "content": [{"type": "text", "text": topics_info}]
             }
+        }
 
 
 async def main():